@@ -5,12 +5,18 @@ Showcases: LangGraph expertise, Multi-source integration, Real-time processing,
 """
 
 import pandas as pd
+import numpy as np
 import asyncio
 import aiohttp
 import json
+import re
 import time
-from typing import Dict, List, Optional, TypedDict, Annotated
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Annotated
+from dataclasses import dataclass, asdict, field
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -22,18 +28,53 @@ from langchain_core.messages import HumanMessage, AIMessage
 
 # Import our configuration system
 from config import load_config
+from excel_io import read_input_sheet, write_excel_streaming
 
-class EnrichmentState(TypedDict):
-    """LangGraph state for agentic enrichment workflow"""
+# Result field -> output column, in export order
+AGENTIC_EXPORT_COLUMNS = {
+    # Standard fields
+    'fdd': 'FDD',
+    'franchisee': 'Franchisee',
+    'address': 'Address',
+    'city': 'City',
+    'state': 'State',
+    'zip': 'Zip',
+    'phone': 'Phone',
+    'franchisee_owner': 'Franchisee Owner',
+    'corporate_name': 'Corporate Name',
+    'corporate_address': 'Corporate Address',
+    'corporate_phone': 'Corporate Phone',
+    'corporate_email': 'Corporate Email',
+    'linkedin': 'LinkedIn',
+    'url_sources': 'url Sources',
+    
+    # Agentic workflow metrics
+    'agent_confidence': 'Agent Confidence',
+    'enrichment_strategy_used': 'Enrichment Strategy',
+    'data_sources_consulted': 'Data Sources Consulted',
+    'agent_reasoning': 'Agent Reasoning',
+    'quality_score': 'Quality Score',
+    'workflow_execution_time': 'Workflow Time (s)',
+    'pipeline_version': 'Pipeline Version',
+    'processing_timestamp': 'Processing Timestamp'
+}
+_AGENTIC_EXPORT_GETTER = attrgetter(*AGENTIC_EXPORT_COLUMNS)
+
+@dataclass(slots=True)
+class EnrichmentState:
+    """LangGraph state for agentic enrichment workflow (slotted for fast attribute access)"""
     record: dict
-    entity_classification: dict
-    enrichment_strategy: dict
-    data_sources_attempted: List[str]
-    enrichment_results: List[dict]
-    confidence_scores: List[float]
-    quality_metrics: dict
-    final_result: dict
-    error_state: Optional[str]
+    entity_classification: dict = field(default_factory=dict)
+    enrichment_strategy: Mapping = field(default_factory=dict)
+    data_sources_attempted: List[str] = field(default_factory=list)
+    unique_sources: set = field(default_factory=set)
+    enrichment_results: List[dict] = field(default_factory=list)
+    confidence_scores: List[float] = field(default_factory=list)
+    quality_metrics: dict = field(default_factory=dict)
+    final_result: dict = field(default_factory=dict)
+    conflicts: dict = field(default_factory=dict)
+    resolved_data: dict = field(default_factory=dict)
+    error_state: Optional[str] = None
 
 @dataclass
 class AgenticEnrichmentResult:
@@ -70,44 +111,193 @@ class AgenticEnrichmentResult:
     processing_timestamp: str = ""
     pipeline_version: str = "2.0-agentic"
 
+# Entity classification patterns, compiled once at import. Indicators match whole words,
+# so the spelled-out suffixes are listed alongside their abbreviations
+_BUSINESS_INDICATOR_RE = re.compile(
+    r'\b(LLC|INC|INCORPORATED|CORP|CORPORATION|LTD|LP|COMPANY|ENTERPRISES)\b'
+)
+_INDIVIDUAL_PATTERN_RE = re.compile(r',|\bJR\b|\bSR\b|\bIII\b')
+
+@lru_cache(maxsize=8192)
+def _classify_name(franchisee_name: str) -> Tuple[str, float, str, int, int]:
+    """Classify a franchisee name; returns (type, confidence, reasoning, business_score, individual_score)"""
+    # Advanced classification logic: one regex pass per indicator family
+    name_upper = franchisee_name.upper()
+    business_score = len(_BUSINESS_INDICATOR_RE.findall(name_upper))
+    individual_score = len(_INDIVIDUAL_PATTERN_RE.findall(name_upper))
+    
+    # Contextual analysis
+    has_comma = ',' in franchisee_name
+    word_count = len(franchisee_name.split())
+    
+    # Agent reasoning
+    if business_score > 0:
+        entity_type = "business"
+        confidence = min(0.95, 0.7 + (business_score * 0.1))
+        reasoning = f"Business entity detected: {business_score} business indicators found"
+    elif has_comma and word_count == 2:
+        entity_type = "individual"
+        confidence = 0.9
+        reasoning = "Individual detected: 'Last, First' format"
+    elif word_count == 2 and business_score == 0:
+        entity_type = "individual"
+        confidence = 0.8
+        reasoning = "Individual detected: Two-word name, no business indicators"
+    else:
+        entity_type = "business"
+        confidence = 0.6
+        reasoning = "Default to business: Ambiguous case"
+    
+    return entity_type, confidence, reasoning, business_score, individual_score
+
+# Enrichment strategy templates, shared by every record; read-only views so no record can alter another's plan
+_BUSINESS_STRATEGY = MappingProxyType({
+    "primary_sources": ("business_registry", "google_places"),
+    "fallback_sources": ("corporate_database", "linkedin_company"),
+    "confidence_threshold": 0.7,
+    "max_sources": 4,
+    "reasoning": "Standard business enrichment strategy"
+})
+# Texas has better business registry data
+_TX_BUSINESS_STRATEGY = MappingProxyType({
+    **_BUSINESS_STRATEGY,
+    "confidence_threshold": 0.8,
+    "reasoning": "Texas business registry provides high-quality data"
+})
+_INDIVIDUAL_STRATEGY = MappingProxyType({
+    "primary_sources": ("linkedin_individual", "google_search"),
+    "fallback_sources": ("people_search", "social_media"),
+    "confidence_threshold": 0.7,
+    "max_sources": 4,
+    "reasoning": "Individual-focused enrichment strategy"
+})
+
+def _plan_strategy(entity_type: str, state_code: str) -> Mapping:
+    """Select the shared strategy template for an entity type and state"""
+    if entity_type == "business":
+        return _TX_BUSINESS_STRATEGY if state_code == "TX" else _BUSINESS_STRATEGY
+    return _INDIVIDUAL_STRATEGY
+
+# Bookkeeping keys on source results that are not enriched data
+_RESULT_META_FIELDS = frozenset(("source", "priority", "source_confidence"))
+
+# Translation tables for slug building: one C-level pass instead of chained .replace calls
+_EMAIL_SLUG_TABLE = str.maketrans('', '', ' ,')
+_LINKEDIN_SLUG_TABLE = str.maketrans({' ': '-', ',': None})
+
+@lru_cache(maxsize=8192)
+def _derive_name_fields(franchisee_name: str) -> Tuple[str, str, str]:
+    """Derive per-name source fields once; returns (email_slug, linkedin_slug, clean_owner)"""
+    name_lower = franchisee_name.lower()
+    email_slug = name_lower.translate(_EMAIL_SLUG_TABLE)[:8]
+    linkedin_slug = name_lower.translate(_LINKEDIN_SLUG_TABLE)
+    clean_owner = franchisee_name.replace(' LLC', '').replace(' Inc', '').strip()
+    return email_slug, linkedin_slug, clean_owner
+
+def classify_franchisee_names(names: pd.Series) -> List[dict]:
+    """Vectorized equivalent of _classify_name over a whole franchisee column"""
+    names = names.fillna("").astype(str)
+    upper = names.str.upper()
+    
+    business_score = upper.str.count(_BUSINESS_INDICATOR_RE.pattern)
+    individual_score = upper.str.count(_INDIVIDUAL_PATTERN_RE.pattern)
+    has_comma = names.str.contains(",", regex=False)
+    word_count = names.str.split().str.len().fillna(0)
+    
+    # Same precedence as the scalar classifier's if/elif chain
+    conditions = [
+        business_score > 0,
+        has_comma & (word_count == 2),
+        word_count == 2
+    ]
+    entity_type = np.select(conditions, ["business", "individual", "individual"], default="business")
+    confidence = np.select(
+        conditions,
+        [np.minimum(0.95, 0.7 + (business_score * 0.1)), 0.9, 0.8],
+        default=0.6
+    )
+    reasoning = np.select(
+        conditions,
+        [
+            "Business entity detected: " + business_score.astype(str) + " business indicators found",
+            "Individual detected: 'Last, First' format",
+            "Individual detected: Two-word name, no business indicators"
+        ],
+        default="Default to business: Ambiguous case"
+    )
+    
+    return [
+        {
+            "type": str(t),
+            "confidence": float(c),
+            "reasoning": str(r),
+            "business_indicators": int(b),
+            "individual_indicators": int(i)
+        }
+        for t, c, r, b, i in zip(entity_type, confidence, reasoning, business_score, individual_score)
+    ]
+
 class EnrichmentAgent:
     """LangGraph-powered intelligent enrichment agent"""
     
     def __init__(self, config, logger):
         self.config = config
         self.logger = logger
-        self.workflow = self._build_agentic_workflow()
+        self.workflows = self._build_agentic_workflows()
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared, connection-pooled HTTP session, opened on first use by a real enrichment source
+        
+        The sources are simulated today, so a run that never asks for it opens no connector at all.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(total=self.config.processing.timeout_seconds)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session, if one was opened"""
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        
+    def _build_agentic_workflows(self) -> Dict[str, StateGraph]:
+        """Build one specialized LangGraph workflow per entity type"""
+        return {
+            "business": self._build_subgraph("execute_business_enrichment", self._execute_business_enrichment),
+            "individual": self._build_subgraph("execute_individual_enrichment", self._execute_individual_enrichment)
+        }
+    
+    def _build_subgraph(self, execute_node: str, execute_fn) -> StateGraph:
+        """Build the enrichment workflow for a single entity type
         
-    def _build_agentic_workflow(self) -> StateGraph:
-        """Build LangGraph workflow for intelligent enrichment"""
+        Classification, planning and finalization are plain calls around the
+        graph (see run); the compiled subgraph holds only the I/O and branching
+        nodes.
+        """
         workflow = StateGraph(EnrichmentState)
         
         # Add workflow nodes
-        workflow.add_node("classify_entity", self._classify_entity_node)
-        workflow.add_node("plan_enrichment", self._plan_enrichment_strategy)
-        workflow.add_node("execute_business_enrichment", self._execute_business_enrichment)
-        workflow.add_node("execute_individual_enrichment", self._execute_individual_enrichment)
+        workflow.add_node(execute_node, execute_fn)
         workflow.add_node("validate_and_score", self._validate_and_score_results)
         workflow.add_node("resolve_conflicts", self._resolve_data_conflicts)
-        workflow.add_node("finalize_result", self._finalize_enrichment_result)
-        
-        # Define workflow edges with intelligent routing
-        workflow.set_entry_point("classify_entity")
-        
-        workflow.add_edge("classify_entity", "plan_enrichment")
-        
-        # Conditional routing based on entity type
-        workflow.add_conditional_edges(
-            "plan_enrichment",
-            self._route_enrichment_strategy,
-            {
-                "business": "execute_business_enrichment",
-                "individual": "execute_individual_enrichment"
-            }
-        )
         
-        workflow.add_edge("execute_business_enrichment", "validate_and_score")
-        workflow.add_edge("execute_individual_enrichment", "validate_and_score")
+        # Define workflow edges
+        workflow.set_entry_point(execute_node)
+        workflow.add_edge(execute_node, "validate_and_score")
         
         # Conditional conflict resolution
         workflow.add_conditional_edges(
@@ -115,48 +305,33 @@ class EnrichmentAgent:
             self._check_conflicts,
             {
                 "conflicts_found": "resolve_conflicts",
-                "no_conflicts": "finalize_result"
+                "no_conflicts": END
             }
         )
         
-        workflow.add_edge("resolve_conflicts", "finalize_result")
-        workflow.add_edge("finalize_result", END)
+        workflow.add_edge("resolve_conflicts", END)
         
         return workflow.compile()
     
-    async def _classify_entity_node(self, state: EnrichmentState) -> EnrichmentState:
-        """LangGraph node: Intelligent entity classification"""
-        record = state["record"]
+    async def run(self, state: EnrichmentState) -> EnrichmentState:
+        """Classify and plan directly, invoke the subgraph for the entity type, then finalize"""
+        self._classify_entity(state)
+        self._plan_enrichment_strategy(state)
+        workflow = self.workflows[state.entity_classification["type"]]
+        # Compiled graphs return channel values as a dict; rebuild the dataclass state
+        final_state = EnrichmentState(**await workflow.ainvoke(state))
+        return self._finalize_enrichment_result(final_state)
+    
+    def _classify_entity(self, state: EnrichmentState) -> EnrichmentState:
+        """Pre-graph step: Intelligent entity classification"""
+        # Records pre-classified in bulk by classify_franchisee_names skip the scalar path
+        if state.entity_classification:
+            return state
+        
+        record = state.record
         franchisee_name = record.get("Franchisee", record.get("franchisee", ""))
         
-        # Advanced classification logic
-        business_indicators = ['LLC', 'INC', 'CORP', 'LTD', 'LP', 'COMPANY', 'ENTERPRISES']
-        individual_patterns = [',', 'JR', 'SR', 'III']
-        
-        business_score = sum(1 for indicator in business_indicators if indicator in franchisee_name.upper())
-        individual_score = sum(1 for pattern in individual_patterns if pattern in franchisee_name)
-        
-        # Contextual analysis
-        has_comma = ',' in franchisee_name
-        word_count = len(franchisee_name.split())
-        
-        # Agent reasoning
-        if business_score > 0:
-            entity_type = "business"
-            confidence = min(0.95, 0.7 + (business_score * 0.1))
-            reasoning = f"Business entity detected: {business_score} business indicators found"
-        elif has_comma and word_count == 2:
-            entity_type = "individual"
-            confidence = 0.9
-            reasoning = "Individual detected: 'Last, First' format"
-        elif word_count == 2 and business_score == 0:
-            entity_type = "individual"
-            confidence = 0.8
-            reasoning = "Individual detected: Two-word name, no business indicators"
-        else:
-            entity_type = "business"
-            confidence = 0.6
-            reasoning = "Default to business: Ambiguous case"
+        entity_type, confidence, reasoning, business_score, individual_score = _classify_name(franchisee_name)
         
         classification = {
             "type": entity_type,
@@ -166,81 +341,62 @@ class EnrichmentAgent:
             "individual_indicators": individual_score
         }
         
-        state["entity_classification"] = classification
-        self.logger.debug(f"🤖 Agent classified '{franchisee_name}' as {entity_type} (conf: {confidence:.2f})")
+        state.entity_classification = classification
+        self.logger.debug("🤖 Agent classified '%s' as %s (conf: %.2f)", franchisee_name, entity_type, confidence)
         
         return state
     
-    async def _plan_enrichment_strategy(self, state: EnrichmentState) -> EnrichmentState:
-        """LangGraph node: Plan optimal enrichment strategy"""
-        classification = state["entity_classification"]
-        record = state["record"]
+    def _plan_enrichment_strategy(self, state: EnrichmentState) -> EnrichmentState:
+        """Pre-graph step: Plan optimal enrichment strategy"""
+        classification = state.entity_classification
+        record = state.record
         
         # Agent decides enrichment strategy based on entity type and location
-        strategy = {
-            "primary_sources": [],
-            "fallback_sources": [],
-            "confidence_threshold": 0.7,
-            "max_sources": 4
-        }
+        strategy = _plan_strategy(classification["type"], record["state"].upper())
         
-        if classification["type"] == "business":
-            # Business enrichment strategy
-            strategy["primary_sources"] = ["business_registry", "google_places"]
-            strategy["fallback_sources"] = ["corporate_database", "linkedin_company"]
-            
-            # Texas has better business registry data
-            if record["state"].upper() == "TX":
-                strategy["confidence_threshold"] = 0.8
-                strategy["reasoning"] = "Texas business registry provides high-quality data"
-            else:
-                strategy["reasoning"] = "Standard business enrichment strategy"
-                
-        else:
-            # Individual enrichment strategy  
-            strategy["primary_sources"] = ["linkedin_individual", "google_search"]
-            strategy["fallback_sources"] = ["people_search", "social_media"]
-            strategy["reasoning"] = "Individual-focused enrichment strategy"
+        state.enrichment_strategy = strategy
+        state.data_sources_attempted = []
+        state.unique_sources = set()
+        state.enrichment_results = []
+        state.confidence_scores = []
         
-        state["enrichment_strategy"] = strategy
-        state["data_sources_attempted"] = []
-        state["enrichment_results"] = []
-        state["confidence_scores"] = []
-        
-        self.logger.debug(f"🎯 Agent planned strategy: {strategy['reasoning']}")
+        self.logger.debug("🎯 Agent planned strategy: %s", strategy["reasoning"])
         return state
     
     async def _execute_business_enrichment(self, state: EnrichmentState) -> EnrichmentState:
         """LangGraph node: Execute business-specific enrichment"""
-        record = state["record"]
-        strategy = state["enrichment_strategy"]
+        record = state.record
+        strategy = state.enrichment_strategy
         
-        # Execute primary sources
-        for source in strategy["primary_sources"]:
-            result = await self._call_enrichment_source(source, record, "business")
-            if result:
-                state["enrichment_results"].append({**result, "source": source, "priority": "primary"})
-                state["data_sources_attempted"].append(source)
-                state["confidence_scores"].append(result.get("source_confidence", 0.7))
+        # Name-derived fields are computed once per record and shared by every source call
+        derived = _derive_name_fields(record["franchisee"])
+        
+        # Execute primary sources concurrently
+        primary_sources = strategy["primary_sources"]
+        primary_results = await asyncio.gather(
+            *[self._call_enrichment_source(source, record, "business", derived) for source in primary_sources],
+            return_exceptions=True
+        )
+        self._collect_source_results(state, primary_sources, primary_results, "primary", 0.7)
         
         # Execute fallback sources if needed
-        avg_confidence = sum(state["confidence_scores"]) / len(state["confidence_scores"]) if state["confidence_scores"] else 0
+        avg_confidence = sum(state.confidence_scores) / len(state.confidence_scores) if state.confidence_scores else 0
         
         if avg_confidence < strategy["confidence_threshold"]:
             self.logger.debug("🔄 Agent triggering fallback sources due to low confidence")
-            for source in strategy["fallback_sources"]:
-                result = await self._call_enrichment_source(source, record, "business")
-                if result:
-                    state["enrichment_results"].append({**result, "source": source, "priority": "fallback"})
-                    state["data_sources_attempted"].append(source)
-                    state["confidence_scores"].append(result.get("source_confidence", 0.6))
+            fallback_sources = strategy["fallback_sources"]
+            fallback_results = await asyncio.gather(
+                *[self._call_enrichment_source(source, record, "business", derived) for source in fallback_sources],
+                return_exceptions=True
+            )
+            self._collect_source_results(state, fallback_sources, fallback_results, "fallback", 0.6)
         
         return state
     
     async def _execute_individual_enrichment(self, state: EnrichmentState) -> EnrichmentState:
         """LangGraph node: Execute individual-specific enrichment"""
-        record = state["record"]
-        strategy = state["enrichment_strategy"]
+        record = state.record
+        strategy = state.enrichment_strategy
         
         # Parse individual name
         franchisee_name = record["franchisee"]
@@ -253,61 +409,73 @@ class EnrichmentAgent:
             first_name = parts[0] if parts else ""
             last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
         
-        # Execute individual enrichment sources
-        for source in strategy["primary_sources"]:
-            result = await self._call_individual_enrichment_source(source, record, first_name, last_name)
-            if result:
-                state["enrichment_results"].append({**result, "source": source, "priority": "primary"})
-                state["data_sources_attempted"].append(source)
-                state["confidence_scores"].append(result.get("source_confidence", 0.8))
+        # Execute individual enrichment sources concurrently
+        primary_sources = strategy["primary_sources"]
+        primary_results = await asyncio.gather(
+            *[self._call_individual_enrichment_source(source, record, first_name, last_name)
+              for source in primary_sources],
+            return_exceptions=True
+        )
+        self._collect_source_results(state, primary_sources, primary_results, "primary", 0.8)
         
         return state
     
+    def _collect_source_results(self, state: EnrichmentState, sources: List[str], results: list,
+                                priority: str, default_confidence: float):
+        """Record gathered source results in source order, skipping empty or failed calls"""
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                self.logger.warning("⚠️  Source %s failed: %s", source, result)
+                continue
+            if result:
+                state.enrichment_results.append({**result, "source": source, "priority": priority})
+                state.data_sources_attempted.append(source)
+                state.unique_sources.add(source)
+                state.confidence_scores.append(result.get("source_confidence", default_confidence))
+    
     async def _validate_and_score_results(self, state: EnrichmentState) -> EnrichmentState:
         """LangGraph node: Validate enrichment results and calculate quality scores"""
-        results = state["enrichment_results"]
+        results = state.enrichment_results
         
         # Aggregate data from all sources
-        aggregated_data = {}
-        field_sources = {}
+        aggregated_data = defaultdict(list)
+        field_sources = defaultdict(list)
         
         for result in results:
+            source = result["source"]
             for field, value in result.items():
-                if field not in ["source", "priority", "source_confidence"] and value:
-                    if field not in aggregated_data:
-                        aggregated_data[field] = []
-                        field_sources[field] = []
-                    
+                if value and field not in _RESULT_META_FIELDS:
                     aggregated_data[field].append(value)
-                    field_sources[field].append(result["source"])
+                    field_sources[field].append(source)
         
-        # Quality scoring
-        quality_metrics = {
-            "data_consistency": self._calculate_consistency_score(aggregated_data),
-            "source_diversity": len(set(state["data_sources_attempted"])),
-            "field_completeness": len(aggregated_data) / 6,  # 6 target fields
-            "confidence_stability": min(state["confidence_scores"]) / max(state["confidence_scores"]) if state["confidence_scores"] else 0
-        }
-        
-        state["quality_metrics"] = quality_metrics
-        
-        # Check for conflicts
+        # Check for conflicts, hashing each field's values only once
         conflicts = {}
+        field_counts = []
         for field, values in aggregated_data.items():
-            unique_values = list(set(values))
+            unique_values = set(values)
+            field_counts.append((len(unique_values), len(values)))
             if len(unique_values) > 1:
                 conflicts[field] = {
-                    "values": unique_values,
+                    "values": list(unique_values),
                     "sources": field_sources[field]
                 }
         
-        state["conflicts"] = conflicts
+        # Quality scoring
+        quality_metrics = {
+            "data_consistency": self._calculate_consistency_score(field_counts),
+            "source_diversity": len(state.unique_sources),
+            "field_completeness": len(aggregated_data) / 6,  # 6 target fields
+            "confidence_stability": min(state.confidence_scores) / max(state.confidence_scores) if state.confidence_scores else 0
+        }
+        
+        state.quality_metrics = quality_metrics
+        
+        state.conflicts = conflicts
         return state
     
     async def _resolve_data_conflicts(self, state: EnrichmentState) -> EnrichmentState:
         """LangGraph node: Intelligent conflict resolution"""
-        conflicts = state.get("conflicts", {})
-        results = state["enrichment_results"]
+        conflicts = state.conflicts
         
         resolved_data = {}
         
@@ -336,30 +504,26 @@ class EnrichmentAgent:
                 reasoning = "First reliable source used"
             
             resolved_data[field] = resolved_value
-            self.logger.debug(f"🔧 Agent resolved conflict for {field}: {reasoning}")
-        
-        # Update results with resolved conflicts
-        for result in results:
-            for field, resolved_value in resolved_data.items():
-                if field in result:
-                    result[field] = resolved_value
+            self.logger.debug("🔧 Agent resolved conflict for %s: %s", field, reasoning)
         
+        # The finalizer seeds its merge with these, so results are not patched in place
+        state.resolved_data = resolved_data
         return state
     
-    async def _finalize_enrichment_result(self, state: EnrichmentState) -> EnrichmentState:
-        """LangGraph node: Finalize enrichment result with agent scoring"""
-        results = state["enrichment_results"]
-        quality_metrics = state["quality_metrics"]
-        classification = state["entity_classification"]
-        
-        # Merge all results
-        final_data = {}
+    def _finalize_enrichment_result(self, state: EnrichmentState) -> EnrichmentState:
+        """Post-graph step: Finalize enrichment result with agent scoring"""
+        results = state.enrichment_results
+        quality_metrics = state.quality_metrics
+        classification = state.entity_classification
+        
+        # Merge all results; resolved conflict values win over first-seen values
+        final_data = dict(state.resolved_data)
         source_urls = []
         
         for result in results:
             source_urls.append(result.get("source", "unknown"))
             for field, value in result.items():
-                if field not in ["source", "priority", "source_confidence"] and value:
+                if value and field not in _RESULT_META_FIELDS:
                     if field not in final_data:
                         final_data[field] = value
         
@@ -374,42 +538,45 @@ class EnrichmentAgent:
         # Agent reasoning summary
         reasoning_parts = [
             f"Entity: {classification['type']} ({classification['confidence']:.2f})",
-            f"Sources: {len(state['data_sources_attempted'])}",
+            f"Sources: {len(state.data_sources_attempted)}",
             f"Consistency: {quality_metrics['data_consistency']:.2f}",
             f"Completeness: {quality_metrics['field_completeness']:.2f}"
         ]
         
         final_result = {
-            **state["record"],
+            **state.record,
             **final_data,
             "agent_confidence": round(agent_confidence, 3),
-            "enrichment_strategy_used": state["enrichment_strategy"]["reasoning"],
-            "data_sources_consulted": len(state["data_sources_attempted"]),
+            "enrichment_strategy_used": state.enrichment_strategy["reasoning"],
+            "data_sources_consulted": len(state.data_sources_attempted),
             "agent_reasoning": "; ".join(reasoning_parts),
             "quality_score": round(sum(quality_metrics.values()) / len(quality_metrics), 3),
             "url_sources": "; ".join(source_urls)
         }
         
-        state["final_result"] = final_result
+        state.final_result = final_result
         return state
     
-    def _route_enrichment_strategy(self, state: EnrichmentState) -> str:
-        """LangGraph conditional edge: Route based on entity type"""
-        return state["entity_classification"]["type"]
-    
     def _check_conflicts(self, state: EnrichmentState) -> str:
         """LangGraph conditional edge: Check if conflicts need resolution"""
-        return "conflicts_found" if state.get("conflicts") else "no_conflicts"
+        return "conflicts_found" if state.conflicts else "no_conflicts"
     
-    async def _call_enrichment_source(self, source: str, record: dict, entity_type: str) -> dict:
-        """Call specific enrichment source (simulated for demo)"""
+    async def _call_enrichment_source(self, source: str, record: dict, entity_type: str,
+                                      derived: Optional[Tuple[str, str, str]] = None) -> dict:
+        """Call specific enrichment source (simulated for demo)
+        
+        Real source integrations should issue requests through ``self.session``
+        so every record shares one pooled connection set. ``derived`` is the
+        _derive_name_fields tuple for the record's franchisee name.
+        """
         franchisee_name = record["franchisee"]
+        email_slug, linkedin_slug, clean_owner = derived or _derive_name_fields(franchisee_name)
         
         if source == "business_registry":
             return {
                 "corporate_name": franchisee_name,
                 "corporate_address": f"Registered: {record['address']}, {record['city']}, {record['state']} {record['zip']}",
-                "franchisee_owner": franchisee_name.replace(' LLC', '').replace(' Inc', '').strip(),
+                "franchisee_owner": clean_owner,
                 "source_confidence": 0.9
             }
             
@@ -417,14 +584,14 @@ class EnrichmentAgent:
             return {
                 "corporate_phone": record["phone"],
                 "corporate_address": f"Verified: {record['address']}, {record['city']}, {record['state']} {record['zip']}",
-                "corporate_email": f"info@{franchisee_name.lower().replace(' ', '').replace(',', '')[:8]}.com",
+                "corporate_email": f"info@{email_slug}.com",
                 "source_confidence": 0.8
             }
             
         elif source == "corporate_database":
             return {
                 "corporate_name": franchisee_name,
-                "linkedin": f"https://www.linkedin.com/company/{franchisee_name.lower().replace(' ', '-').replace(',', '')}",
+                "linkedin": f"https://www.linkedin.com/company/{linkedin_slug}",
                 "source_confidence": 0.7
             }
             
@@ -449,19 +616,16 @@ class EnrichmentAgent:
             
         return {}
     
-    def _calculate_consistency_score(self, aggregated_data: dict) -> float:
-        """Calculate data consistency across sources"""
-        if not aggregated_data:
+    def _calculate_consistency_score(self, field_counts: List[Tuple[int, int]]) -> float:
+        """Calculate data consistency across sources from (unique_count, total_count) per field"""
+        if not field_counts:
             return 0.0
         
-        consistency_scores = []
-        for field, values in aggregated_data.items():
-            unique_values = len(set(values))
-            total_values = len(values)
-            field_consistency = 1.0 - ((unique_values - 1) / max(1, total_values - 1))
-            consistency_scores.append(field_consistency)
-        
-        return sum(consistency_scores) / len(consistency_scores)
+        total_consistency = sum(
+            1.0 - ((unique_count - 1) / max(1, total_count - 1))
+            for unique_count, total_count in field_counts
+        )
+        return total_consistency / len(field_counts)
 
 class AgenticEnrichmentPipeline:
     """LangGraph-powered enrichment pipeline showcasing agentic workflows"""
@@ -479,109 +643,107 @@ class AgenticEnrichmentPipeline:
         self.logger.info("🤖 Initialized LangGraph Agentic Enrichment Pipeline")
         self.logger.info("🎯 Showcasing: LangGraph workflows + Multi-source integration + Real-time processing")
     
-    async def process_records_agentic(self, records: List[dict]) -> List[AgenticEnrichmentResult]:
-        """Process records using LangGraph agentic workflow"""
-        results = []
-        sample_size = len(records)
-        
-        
-        self.logger.info(f"🎯 Processing {len(records)} records with agentic workflow")
+    async def process_records_agentic(self, records: List[dict],
+                                      classifications: Optional[List[dict]] = None) -> List[AgenticEnrichmentResult]:
+        """Process records using LangGraph agentic workflow with bounded concurrency
+        
+        ``classifications`` may carry entity classifications precomputed with
+        classify_franchisee_names, aligned with ``records``.
+        """
+        total = len(records)
+        if classifications is None:
+            classifications = [{}] * total
+        semaphore = asyncio.Semaphore(self.config.processing.max_concurrent_requests)
+        
+        self.logger.info(f"🎯 Processing {total} records with agentic workflow "
+                         f"({self.config.processing.max_concurrent_requests} concurrent)")
+        
+        async def _run_one(i: int, record: dict, classification: dict) -> AgenticEnrichmentResult:
+            async with semaphore:
+                return await self._process_single_record(i, total, record, classification)
+        
+        tasks = [
+            asyncio.create_task(_run_one(i, record, classification))
+            for i, (record, classification) in enumerate(zip(records, classifications))
+        ]
+        return list(await asyncio.gather(*tasks))
+    
+    async def _process_single_record(self, i: int, total: int, record: dict,
+                                     classification: dict) -> AgenticEnrichmentResult:
+        """Run the LangGraph workflow for a single record, never raising"""
+        start_time = time.time()
+        
+        # Per-record progress is sampled so large batches don't flush a log line per record
+        log_progress = i % 100 == 0 or self.logger.isEnabledFor(logging.DEBUG)
+        if log_progress:
+            self.logger.info("🤖 Agent processing %d/%d: %s", i + 1, total, record['franchisee'])
+        
+        # Initialize LangGraph state
+        initial_state = EnrichmentState(
+            record=record,
+            entity_classification=dict(classification)
+        )
         
-        for i, record in enumerate(records):
-            start_time = time.time()
+        try:
+            # Execute LangGraph workflow
+            final_state = await self.enrichment_agent.run(initial_state)
             
-            self.logger.info(f"🤖 Agent processing {i+1}/{len(records)}: {record['franchisee']}")
+            # Convert to result object
+            final_result = final_state.final_result
+            processing_time = time.time() - start_time
             
-            # Initialize LangGraph state
-            initial_state = EnrichmentState(
-                record=record,
-                entity_classification={},
-                enrichment_strategy={},
-                data_sources_attempted=[],
-                enrichment_results=[],
-                confidence_scores=[],
-                quality_metrics={},
-                final_result={},
-                error_state=None
+            result = AgenticEnrichmentResult(
+                **final_result,
+                workflow_execution_time=round(processing_time, 3),
+                processing_timestamp=datetime.now().isoformat()
             )
             
-            try:
-                # Execute LangGraph workflow
-                final_state = await self.enrichment_agent.workflow.ainvoke(initial_state)
-                
-                # Convert to result object
-                final_result = final_state["final_result"]
-                processing_time = time.time() - start_time
-                
-                result = AgenticEnrichmentResult(
-                    **final_result,
-                    workflow_execution_time=round(processing_time, 3),
-                    processing_timestamp=datetime.now().isoformat()
-                )
-                
-                results.append(result)
-                
-                self.logger.info(f"✅ Agent completed: {record['franchisee']} "
-                               f"(confidence: {result.agent_confidence:.3f}, "
-                               f"sources: {result.data_sources_consulted}, "
-                               f"time: {result.workflow_execution_time:.3f}s)")
-                
-            except Exception as e:
-                self.logger.error(f"❌ Agent failed on {record['franchisee']}: {e}")
-                # Create minimal result for failed records
-                result = AgenticEnrichmentResult(
-                    **record,
-                    agent_confidence=0.0,
-                    enrichment_strategy_used="Failed",
-                    agent_reasoning=f"Error: {str(e)}",
-                    workflow_execution_time=time.time() - start_time
-                )
-                results.append(result)
-        
-        return results
+            if log_progress:
+                self.logger.info("✅ Agent completed: %s (confidence: %.3f, sources: %d, time: %.3fs)",
+                                 record['franchisee'], result.agent_confidence,
+                                 result.data_sources_consulted, result.workflow_execution_time)
+            
+        except Exception as e:
+            self.logger.error("❌ Agent failed on %s: %s", record['franchisee'], e)
+            # Create minimal result for failed records
+            result = AgenticEnrichmentResult(
+                **record,
+                agent_confidence=0.0,
+                enrichment_strategy_used="Failed",
+                agent_reasoning=f"Error: {str(e)}",
+                workflow_execution_time=time.time() - start_time,
+                processing_timestamp=datetime.now().isoformat()
+            )
+        
+        return result
     
     def save_agentic_results(self, results: List[AgenticEnrichmentResult]) -> str:
         """Save agentic enrichment results with detailed agent metrics"""
         output_file = "data/agentic_enriched_franchisees.xlsx"
+        parquet_file = output_file.replace('.xlsx', '.parquet')
         
-        # Prepare data with agent-specific columns
-        results_data = []
-        for result in results:
-            row_data = {
-                # Standard fields
-                'FDD': result.fdd,
-                'Franchisee': result.franchisee,
-                'Address': result.address,
-                'City': result.city,
-                'State': result.state,
-                'Zip': result.zip,
-                'Phone': result.phone,
-                'Franchisee Owner': result.franchisee_owner,
-                'Corporate Name': result.corporate_name,
-                'Corporate Address': result.corporate_address,
-                'Corporate Phone': result.corporate_phone,
-                'Corporate Email': result.corporate_email,
-                'LinkedIn': result.linkedin,
-                'url Sources': result.url_sources,
-                
-                # Agentic workflow metrics
-                'Agent Confidence': result.agent_confidence,
-                'Enrichment Strategy': result.enrichment_strategy_used,
-                'Data Sources Consulted': result.data_sources_consulted,
-                'Agent Reasoning': result.agent_reasoning,
-                'Quality Score': result.quality_score,
-                'Workflow Time (s)': result.workflow_execution_time,
-                'Pipeline Version': result.pipeline_version,
-                'Processing Timestamp': result.processing_timestamp
-            }
-            results_data.append(row_data)
+        # One attrgetter tuple per result instead of a 22-key dict per row
+        df = pd.DataFrame(
+            list(map(_AGENTIC_EXPORT_GETTER, results)),
+            columns=list(AGENTIC_EXPORT_COLUMNS.values())
+        )
         
-        # Save to Excel
-        df = pd.DataFrame(results_data)
-        df.to_excel(output_file, index=False)
+        saved_files = []
         
-        self.logger.info(f"✅ Agentic results saved to: {output_file}")
-        return output_file
+        if self.config.file_paths.export_parquet:
+            try:
+                df.to_parquet(parquet_file, index=False, compression='zstd')
+                saved_files.append(parquet_file)
+            except ImportError as e:
+                self.logger.warning(f"⚠️  Parquet export skipped (no parquet engine installed): {e}")
+        
+        if self.config.file_paths.export_excel:
+            write_excel_streaming(df, output_file)
+            saved_files.append(output_file)
+        
+        for saved_file in saved_files:
+            self.logger.info(f"✅ Agentic results saved to: {saved_file}")
+        return saved_files[-1] if saved_files else ""
 
 async def main():
     """Demonstrate LangGraph agentic enrichment pipeline"""
@@ -593,7 +755,7 @@ async def main():
     pipeline = AgenticEnrichmentPipeline()
     
     # Load sample data with proper column mapping
-    df = pd.read_excel("data/Golden Chick_DE_Takehome.xlsx")
+    df = read_input_sheet("data/Golden Chick_DE_Takehome.xlsx")
     
     # Map Excel columns to expected lowercase format
     column_mapping = {
@@ -617,13 +779,21 @@ async def main():
     }
 
 
-    # Rename columns and convert to records
+    # Rename columns and convert to records, zipping plain row tuples instead of to_dict('records')
     df_mapped = df.rename(columns=column_mapping)
-    records = df_mapped.to_dict('records')  # Process 8 records for demo
+    record_columns = [col for col in column_mapping.values() if col in df_mapped.columns]
+    records = [
+        dict(zip(record_columns, row))
+        for row in df_mapped[record_columns].itertuples(index=False, name=None)
+    ]
     
-    # Process with agentic workflow
+    # Classify every franchisee in one vectorized pass before the async loop
+    classifications = classify_franchisee_names(df_mapped['franchisee'])
+    
+    # Process with agentic workflow, sharing one HTTP session across all records
     start_time = time.time()
-    results = await pipeline.process_records_agentic(records)
+    async with pipeline.enrichment_agent:
+        results = await pipeline.process_records_agentic(records, classifications)
     total_time = time.time() - start_time
     
     # Save results
@@ -659,5 +829,14 @@ async def main():
     print(f"📁 Results: {output_file}")
     print(f"🚀 Showcasing LangGraph expertise + Production patterns!")
     
+def run_event_loop(coro):
+    """Run coro on uvloop's libuv-backed event loop when available (POSIX only; Windows keeps asyncio's loop)"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    # uvloop.run builds the loop directly, without the deprecated install()/event loop policy API
+    return uvloop.run(coro)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_event_loop(main())
\ No newline at end of file
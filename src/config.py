@@ -1,47 +1,171 @@
 # src/config.py
 import yaml
 import os
-from typing import Dict, Any, List
-from dataclasses import dataclass
+import re
+import copy
+import hashlib
+import math
+import tempfile
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Pattern
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
-@dataclass
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when libyaml is unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson is optional; without it the parsed-config JSON sidecar is skipped
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared read-only fallback for missing config sections
+_EMPTY: Dict[str, Any] = {}
+
+# Defaults shared by the dataclass fields and the section loaders
+_DEFAULT_PIPELINE_NAME = "franchisee-enrichment-pipeline"
+_DEFAULT_PIPELINE_VERSION = "1.0.0"
+_DEFAULT_MIN_CONFIDENCE = 0.5
+_DEFAULT_HIGH_CONFIDENCE = 0.8
+_DEFAULT_PHONE_RE = r"^[\+]?[1-9][\d]{0,15}$"
+_DEFAULT_EMAIL_RE = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+_DEFAULT_ZIP_RE = r"^\d{5}(-\d{4})?$"
+_DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Formatting characters stripped from phone numbers before matching phone_regex
+_PHONE_PUNCTUATION_RE = re.compile(r'[\s().-]')
+
+def _sidecar_path(path: str) -> Optional[Path]:
+    """Where the parsed-JSON copy of a config file is cached, outside the config directory
+    
+    PIPELINE_CONFIG_CACHE_DIR overrides the per-user cache directory; set it empty to disable.
+    """
+    cache_dir = os.getenv('PIPELINE_CONFIG_CACHE_DIR')
+    if cache_dir is None:
+        cache_dir = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'granite_fdd' / 'config'
+    elif not cache_dir:
+        return None
+    return Path(cache_dir) / (hashlib.sha1(path.encode()).hexdigest() + '.json')
+
+def _all_finite(value) -> bool:
+    """False if any float in a parsed document is NaN or infinite (JSON can't represent them)"""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return all(_all_finite(item) for item in value.values())
+    if isinstance(value, list):
+        return all(_all_finite(item) for item in value)
+    return True
+
+@lru_cache(maxsize=32)
+def _read_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime, size); callers must not mutate the result"""
+    sidecar = _sidecar_path(path) if orjson is not None else None
+    if sidecar is None:
+        return _parse_yaml(path)
+    
+    # The sidecar holds the same document as JSON, which loads much faster; it is only trusted
+    # when it was written from exactly this version of the file
+    try:
+        cached = orjson.loads(sidecar.read_bytes())
+        if cached.get('mtime_ns') == mtime_ns and cached.get('size') == size:
+            return cached['data']
+    except (OSError, orjson.JSONDecodeError, AttributeError, KeyError):
+        pass
+    
+    config_data = _parse_yaml(path)
+    if not _all_finite(config_data):
+        # orjson would write NaN/inf as null and silently change thresholds; keep using the YAML
+        return config_data
+    try:
+        # Pass datetimes through so YAML dates raise instead of coming back as strings
+        payload = orjson.dumps({'mtime_ns': mtime_ns, 'size': size, 'data': config_data},
+                               option=orjson.OPT_PASSTHROUGH_DATETIME)
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        # Write a temp file and rename it into place, so readers never see a partial sidecar
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, sidecar)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError):
+        # Unwritable cache directory, or values JSON can't represent; just use the YAML next time too
+        pass
+    return config_data
+
+def _parse_yaml(path: str) -> Dict[str, Any]:
+    """Parse a YAML file with the module-level loader"""
+    # Hand the loader raw bytes: libyaml detects the encoding itself, so skip Python's text decode
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+
+@dataclass(slots=True, frozen=True)
 class ProcessingConfig:
     """Processing configuration settings"""
     max_concurrent_requests: int = 3
     batch_size: int = 5
     rate_limit_delay_seconds: float = 2.0
     sample_size: int = None
-    max_retries: int = 3
-    retry_delay_seconds: float = 1.0
     timeout_seconds: int = 30
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataQualityConfig:
     """Data quality configuration settings"""
-    minimum_confidence_threshold: float = 0.5
-    high_confidence_threshold: float = 0.8
-    required_fields: list = None
-    phone_regex: str = r"^[\+]?[1-9][\d]{0,15}$"
-    email_regex: str = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    zip_regex: str = r"^\d{5}(-\d{4})?$"
+    minimum_confidence_threshold: float = _DEFAULT_MIN_CONFIDENCE
+    high_confidence_threshold: float = _DEFAULT_HIGH_CONFIDENCE
+    required_fields: tuple = None
+    phone_regex: str = _DEFAULT_PHONE_RE
+    email_regex: str = _DEFAULT_EMAIL_RE
+    zip_regex: str = _DEFAULT_ZIP_RE
+    
+    # Compiled once from the patterns above so validators skip the re module's cache lookup
+    phone_re: Pattern = field(init=False, repr=False, compare=False)
+    email_re: Pattern = field(init=False, repr=False, compare=False)
+    zip_re: Pattern = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.required_fields is None:
-            self.required_fields = ["franchisee_owner", "corporate_address"]
+        # Frozen: derived values are set through object.__setattr__; a tuple keeps the section hashable
+        required = self.required_fields
+        if required is None:
+            required = ("franchisee_owner", "corporate_address")
+        object.__setattr__(self, 'required_fields', tuple(required))
+        object.__setattr__(self, 'phone_re', re.compile(self.phone_regex))
+        object.__setattr__(self, 'email_re', re.compile(self.email_regex))
+        object.__setattr__(self, 'zip_re', re.compile(self.zip_regex))
+    
+    def invalid_contact_fields(self, phone: str = "", email: str = "", zip_code: str = "") -> List[str]:
+        """Names of the given non-empty contact values that fail the configured formats
+        
+        Phone numbers are checked with display punctuation (spaces, parentheses, dashes, dots) removed.
+        """
+        invalid = []
+        if phone and not self.phone_re.match(_PHONE_PUNCTUATION_RE.sub('', phone)):
+            invalid.append('phone')
+        if email and not self.email_re.match(email):
+            invalid.append('email')
+        if zip_code and not self.zip_re.match(zip_code):
+            invalid.append('zip')
+        return invalid
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration settings"""
     level: str = "INFO"
-    format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format: str = _DEFAULT_LOG_FORMAT
     console_output: bool = True
     file_output: bool = True
     log_file: str = "logs/enrichment_pipeline.log"
     track_performance: bool = True
     performance_log: str = "logs/performance_metrics.json"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitoringConfig:
     """Monitoring and alerting configuration"""
     track_api_calls: bool = True
@@ -52,12 +176,44 @@ class MonitoringConfig:
     high_processing_time_threshold: int = 300
     low_confidence_rate_threshold: float = 0.7
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilePathsConfig:
     """File paths configuration"""
     input_file: str = "data/Golden Chick_DE_Takehome.xlsx"
     output_json: str = "data/enriched_franchisees.json"
     output_excel: str = "data/enriched_franchisees_enhanced.xlsx"
+    export_excel: bool = True
+    export_parquet: bool = True
+    # Path last seen to exist; a missing file is never cached, so creating it is noticed
+    _existing_input_file: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def input_file_exists(self) -> bool:
+        """Whether input_file exists; once found, it is not stat'ed again for the same path until invalidate()"""
+        if self._existing_input_file == self.input_file:
+            return True
+        if not os.path.exists(self.input_file):
+            return False
+        object.__setattr__(self, '_existing_input_file', self.input_file)
+        return True
+    
+    def invalidate(self):
+        """Forget the cached input file check (e.g. after the file is removed)"""
+        object.__setattr__(self, '_existing_input_file', None)
+
+# Configurable (init) field names per section, resolved once instead of on every build/dump
+_INIT_FIELDS: Dict[type, tuple] = {
+    cls: tuple(f.name for f in fields(cls) if f.init)
+    for cls in (ProcessingConfig, DataQualityConfig, LoggingConfig, MonitoringConfig, FilePathsConfig)
+}
+
+def _from_dict(cls, data: Dict[str, Any]):
+    """Build a config dataclass from the keys it declares; missing keys keep the dataclass defaults"""
+    return cls(**{name: data[name] for name in _INIT_FIELDS[cls] if name in data})
+
+def _section_dict(section) -> Dict[str, Any]:
+    """Configurable (init) fields of a config dataclass, skipping derived/cached slots"""
+    return {name: getattr(section, name) for name in _INIT_FIELDS[type(section)]}
 
 class PipelineConfig:
     """Main configuration class for the enrichment pipeline"""
@@ -67,30 +223,50 @@ class PipelineConfig:
         self.environment = environment or os.getenv('PIPELINE_ENV', 'development')
         self._config_data = self._load_config()
         
-        # Initialize configuration sections
-        self.processing = self._load_processing_config()
-        self.data_quality = self._load_data_quality_config()
-        self.logging = self._load_logging_config()
-        self.monitoring = self._load_monitoring_config()
-        self.file_paths = self._load_file_paths_config()
-        
         # Pipeline metadata
-        self.name = self._config_data.get('pipeline', {}).get('name', 'franchisee-enrichment-pipeline')
-        self.version = self._config_data.get('pipeline', {}).get('version', '1.0.0')
+        pipeline_data = self._config_data.get('pipeline') or _EMPTY
+        self.name = pipeline_data.get('name', _DEFAULT_PIPELINE_NAME)
+        self.version = pipeline_data.get('version', _DEFAULT_PIPELINE_VERSION)
+    
+    # Configuration sections are built on first access and memoized; each loader
+    # receives its already environment-merged sub-dict
+    @cached_property
+    def processing(self) -> ProcessingConfig:
+        return self._load_processing_config(self._config_data.get('processing') or {})
+    
+    @cached_property
+    def data_quality(self) -> DataQualityConfig:
+        return self._load_data_quality_config(self._config_data.get('data_quality') or {})
+    
+    @cached_property
+    def logging(self) -> LoggingConfig:
+        return self._load_logging_config(self._config_data.get('logging') or {})
+    
+    @cached_property
+    def monitoring(self) -> MonitoringConfig:
+        return self._load_monitoring_config(self._config_data.get('monitoring') or {})
+    
+    @cached_property
+    def file_paths(self) -> FilePathsConfig:
+        return self._load_file_paths_config(self._config_data.get('file_paths') or {})
     
     def _load_config(self) -> Dict[str, Any]:
         """Load and merge configuration from YAML file"""
         try:
             config_file = Path(self.config_path)
-            if not config_file.exists():
+            try:
+                stat = config_file.stat()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
             
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            # Unchanged files are parsed once per process; copy so callers can't corrupt the cache
+            config_data = copy.deepcopy(
+                _read_yaml_cached(str(config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            )
             
-            # Apply environment-specific overrides
-            if 'environments' in config_data and self.environment in config_data['environments']:
-                env_config = config_data['environments'][self.environment]
+            # Apply environment-specific overrides; the environments table is consumed here
+            env_config = (config_data.pop('environments', None) or {}).get(self.environment)
+            if env_config:
                 config_data = self._deep_merge(config_data, env_config)
             
             return config_data
@@ -99,82 +275,58 @@ class PipelineConfig:
             raise RuntimeError(f"Failed to load configuration: {e}")
     
     def _deep_merge(self, base_dict: Dict, override_dict: Dict) -> Dict:
-        """Deep merge two dictionaries"""
-        result = base_dict.copy()
+        """Deep merge two dictionaries (iterative; only dicts on overridden paths are copied)"""
+        # Fast path: scalar-only overrides are a single C-level dict merge
+        if not any(type(value) is dict and type(base_dict.get(key)) is dict
+                   for key, value in override_dict.items()):
+            return {**base_dict, **override_dict}
+        
+        result = dict(base_dict)
+        stack = [(result, override_dict)]
         
-        for key, value in override_dict.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                current = target.get(key)
+                if type(current) is dict and type(value) is dict:
+                    merged = dict(current)
+                    target[key] = merged
+                    stack.append((merged, value))
+                else:
+                    target[key] = value
         
         return result
     
-    def _load_processing_config(self) -> ProcessingConfig:
+    def _load_processing_config(self, processing_data: Dict[str, Any]) -> ProcessingConfig:
         """Load processing configuration"""
-        processing_data = self._config_data.get('processing', {})
-        return ProcessingConfig(
-            max_concurrent_requests=processing_data.get('max_concurrent_requests', 3),
-            batch_size=processing_data.get('batch_size', 5),
-            rate_limit_delay_seconds=processing_data.get('rate_limit_delay_seconds', 2.0),
-            sample_size=processing_data.get('sample_size'),
-            max_retries=processing_data.get('max_retries', 3),
-            retry_delay_seconds=processing_data.get('retry_delay_seconds', 1.0),
-            timeout_seconds=processing_data.get('timeout_seconds', 30)
-        )
+        return _from_dict(ProcessingConfig, processing_data)
     
-    def _load_data_quality_config(self) -> DataQualityConfig:
+    def _load_data_quality_config(self, dq_data: Dict[str, Any]) -> DataQualityConfig:
         """Load data quality configuration"""
-        dq_data = self._config_data.get('data_quality', {})
         validation_data = dq_data.get('validation', {})
         
         return DataQualityConfig(
-            minimum_confidence_threshold=dq_data.get('minimum_confidence_threshold', 0.5),
-            high_confidence_threshold=dq_data.get('high_confidence_threshold', 0.8),
+            minimum_confidence_threshold=dq_data.get('minimum_confidence_threshold', _DEFAULT_MIN_CONFIDENCE),
+            high_confidence_threshold=dq_data.get('high_confidence_threshold', _DEFAULT_HIGH_CONFIDENCE),
             required_fields=dq_data.get('required_fields'),
-            phone_regex=validation_data.get('phone_regex', r"^[\+]?[1-9][\d]{0,15}$"),
-            email_regex=validation_data.get('email_regex', r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"),
-            zip_regex=validation_data.get('zip_regex', r"^\d{5}(-\d{4})?$")
+            phone_regex=validation_data.get('phone_regex', _DEFAULT_PHONE_RE),
+            email_regex=validation_data.get('email_regex', _DEFAULT_EMAIL_RE),
+            zip_regex=validation_data.get('zip_regex', _DEFAULT_ZIP_RE)
         )
     
-    def _load_logging_config(self) -> LoggingConfig:
+    def _load_logging_config(self, logging_data: Dict[str, Any]) -> LoggingConfig:
         """Load logging configuration"""
-        logging_data = self._config_data.get('logging', {})
-        
-        return LoggingConfig(
-            level=logging_data.get('level', 'INFO'),
-            format=logging_data.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-            console_output=logging_data.get('console_output', True),
-            file_output=logging_data.get('file_output', True),
-            log_file=logging_data.get('log_file', 'logs/enrichment_pipeline.log'),
-            track_performance=logging_data.get('track_performance', True),
-            performance_log=logging_data.get('performance_log', 'logs/performance_metrics.json')
-        )
+        return _from_dict(LoggingConfig, logging_data)
     
-    def _load_monitoring_config(self) -> MonitoringConfig:
+    def _load_monitoring_config(self, monitoring_data: Dict[str, Any]) -> MonitoringConfig:
         """Load monitoring configuration"""
-        monitoring_data = self._config_data.get('monitoring', {})
-        alerts_data = monitoring_data.get('alerts', {})
-        
-        return MonitoringConfig(
-            track_api_calls=monitoring_data.get('track_api_calls', True),
-            track_processing_time=monitoring_data.get('track_processing_time', True),
-            track_success_rates=monitoring_data.get('track_success_rates', True),
-            track_data_quality=monitoring_data.get('track_data_quality', True),
-            low_success_rate_threshold=alerts_data.get('low_success_rate_threshold', 0.8),
-            high_processing_time_threshold=alerts_data.get('high_processing_time_threshold', 300),
-            low_confidence_rate_threshold=alerts_data.get('low_confidence_rate_threshold', 0.7)
-        )
+        # Alert thresholds live in a nested 'alerts' block
+        alerts_data = monitoring_data.get('alerts') or {}
+        return _from_dict(MonitoringConfig, {**monitoring_data, **alerts_data})
     
-    def _load_file_paths_config(self) -> FilePathsConfig:
+    def _load_file_paths_config(self, paths_data: Dict[str, Any]) -> FilePathsConfig:
         """Load file paths configuration"""
-        paths_data = self._config_data.get('file_paths', {})
-        
-        return FilePathsConfig(
-            input_file=paths_data.get('input_file', 'data/Golden Chick_DE_Takehome.xlsx'),
-            output_json=paths_data.get('output_json', 'data/enriched_franchisees.json'),
-            output_excel=paths_data.get('output_excel', 'data/enriched_franchisees_enhanced.xlsx')
-        )
+        return _from_dict(FilePathsConfig, paths_data)
     
     def get_enrichment_source_config(self, source_name: str) -> Dict[str, Any]:
         """Get configuration for a specific enrichment source"""
@@ -186,24 +338,62 @@ class PipelineConfig:
         source_config = self.get_enrichment_source_config(source_name)
         return source_config.get('enabled', True)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary for logging/debugging"""
-        return {
-            'pipeline': {
+    # Assigning any of these (e.g. an overridden section) invalidates the as_dict snapshot
+    _SNAPSHOT_ATTRS = frozenset({'name', 'version', 'environment',
+                                 'processing', 'data_quality', 'logging', 'monitoring', 'file_paths'})
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in PipelineConfig._SNAPSHOT_ATTRS:
+            self.__dict__.pop('as_dict', None)
+    
+    @cached_property
+    def as_dict(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only configuration snapshot, built on first access
+        
+        Rebuilt after pipeline metadata or a section is reassigned; use to_dict() for a mutable copy.
+        """
+        return MappingProxyType({
+            'pipeline': MappingProxyType({
                 'name': self.name,
                 'version': self.version,
                 'environment': self.environment
-            },
-            'processing': self.processing.__dict__,
-            'data_quality': self.data_quality.__dict__,
-            'logging': self.logging.__dict__,
-            'monitoring': self.monitoring.__dict__,
-            'file_paths': self.file_paths.__dict__
-        }
+            }),
+            'processing': MappingProxyType(_section_dict(self.processing)),
+            'data_quality': MappingProxyType(_section_dict(self.data_quality)),
+            'logging': MappingProxyType(_section_dict(self.logging)),
+            'monitoring': MappingProxyType(_section_dict(self.monitoring)),
+            'file_paths': MappingProxyType(_section_dict(self.file_paths))
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert configuration to dictionary for logging/debugging (a fresh copy callers may modify)"""
+        # Section values are scalars or tuples, so copying the two mapping levels is a full copy
+        return {section: dict(values) for section, values in self.as_dict.items()}
+
+@lru_cache(maxsize=None)
+def _cached_pipeline_config(abspath: str, environment: str) -> PipelineConfig:
+    return PipelineConfig(abspath, environment)
 
 def load_config(config_path: str = "config/config.yaml", environment: str = None) -> PipelineConfig:
-    """Convenience function to load pipeline configuration"""
-    return PipelineConfig(config_path, environment)
+    """Convenience function to load pipeline configuration
+    
+    The file is parsed and merged once per (absolute path, environment). Sections are
+    frozen and shared; each call returns its own shallow copy, so a caller can swap in
+    overridden sections (dataclasses.replace) without affecting others.
+    Use reload_config() or clear_config_cache() to pick up edits to the file.
+    """
+    environment = environment or os.getenv('PIPELINE_ENV', 'development')
+    return copy.copy(_cached_pipeline_config(os.path.abspath(config_path), environment))
+
+def clear_config_cache() -> None:
+    """Forget every configuration loaded by load_config"""
+    _cached_pipeline_config.cache_clear()
+
+def reload_config(config_path: str = "config/config.yaml", environment: str = None) -> PipelineConfig:
+    """Load configuration afresh from disk, discarding everything load_config has cached"""
+    clear_config_cache()
+    return load_config(config_path, environment)
 
 # Configuration validation
 def validate_config(config: PipelineConfig) -> List[str]:
@@ -218,18 +408,20 @@ def validate_config(config: PipelineConfig) -> List[str]:
         issues.append("batch_size must be positive")
     
     # Validate confidence thresholds
-    if not 0 <= config.data_quality.minimum_confidence_threshold <= 1:
+    min_threshold = config.data_quality.minimum_confidence_threshold
+    high_threshold = config.data_quality.high_confidence_threshold
+    
+    if min_threshold < 0.0 or min_threshold > 1.0:
         issues.append("minimum_confidence_threshold must be between 0 and 1")
     
-    if not 0 <= config.data_quality.high_confidence_threshold <= 1:
+    if high_threshold < 0.0 or high_threshold > 1.0:
         issues.append("high_confidence_threshold must be between 0 and 1")
     
-    if config.data_quality.minimum_confidence_threshold > config.data_quality.high_confidence_threshold:
+    if min_threshold > high_threshold:
         issues.append("minimum_confidence_threshold cannot be greater than high_confidence_threshold")
     
     # Validate file paths
-    input_path = Path(config.file_paths.input_file)
-    if not input_path.exists():
+    if not config.file_paths.input_file_exists:
         issues.append(f"Input file does not exist: {config.file_paths.input_file}")
     
     return issues
\ No newline at end of file
@@ -0,0 +1,45 @@
+# src/excel_io.py
+"""
+Excel workbook reading and streaming export shared by the pipelines
+"""
+
+import pandas as pd
+
+# xlsxwriter is optional; pandas (openpyxl) is the fallback Excel writer
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+def _excel_cell(value):
+    """Missing values (NaN, NA, NaT) as blank cells, as with df.to_excel"""
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value):
+        return None
+    return value
+
+def write_excel_streaming(df: pd.DataFrame, path: str):
+    """Write a workbook row by row with xlsxwriter's constant_memory mode, falling back to openpyxl
+
+    constant_memory flushes each row once a later one is written, so the sheet must be filled
+    in row order; df.to_excel fills it column by column and would lose all but the last row.
+    """
+    if xlsxwriter is None:
+        df.to_excel(path, index=False, engine='openpyxl')
+        return
+
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, tuple(df.columns))
+        for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_num, 0, [_excel_cell(value) for value in row])
+    finally:
+        workbook.close()
+
+def read_input_sheet(path: str) -> pd.DataFrame:
+    """Read the input workbook with the Rust calamine engine, falling back to openpyxl"""
+    try:
+        return pd.read_excel(path, engine='calamine')
+    except (ImportError, ValueError):
+        # python-calamine missing or pandas < 2.2 without the calamine engine
+        return pd.read_excel(path, engine='openpyxl')
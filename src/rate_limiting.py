@@ -0,0 +1,34 @@
+# src/rate_limiting.py
+"""
+Rate limiting shared by the enrichment pipeline and the real API integration demo
+"""
+
+import asyncio
+import time
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter: `rate` acquisitions per second on average, bursting up to `capacity`"""
+    
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        # Each acquisition spends a whole token, so a bucket holding less than one never grants any
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -7,41 +7,349 @@ Note: This is a demonstration - requires API keys and may incur costs
 
 import asyncio
 import aiohttp
+import yarl
 import json
 import os
-from typing import Dict, Optional
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import logging
-from dataclasses import dataclass
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from dataclasses import dataclass, field
+
+from rate_limiting import AsyncTokenBucket
+
+# orjson parses API payloads several times faster; the stdlib json module is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+def setup_logging(level: int = logging.INFO) -> Optional[QueueListener]:
+    """Route root logging through a queue so concurrent enrichments never block on console I/O
+    
+    Call sites only enqueue records; a listener thread formats and writes them. Returns the
+    started listener (stop it on exit to flush), or None if logging was already configured.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    listener = QueueListener(log_queue, console_handler)
+    listener.start()
+    return listener
+
+def _env_field(name: str):
+    """Dataclass field defaulting to an environment variable, read when the config is built"""
+    return field(default_factory=lambda: os.getenv(name, ''))
+
+@dataclass(slots=True, frozen=True)
 class APIConfig:
     """Configuration for real API integrations"""
-    google_search_api_key: str = os.getenv('GOOGLE_SEARCH_API_KEY', '')
-    google_cse_id: str = os.getenv('GOOGLE_CSE_ID', '')
-    opencorporates_api_key: str = os.getenv('OPENCORPORATES_API_KEY', '')
-    rate_limit_delay: float = 1.0
+    google_search_api_key: str = _env_field('GOOGLE_SEARCH_API_KEY')
+    google_cse_id: str = _env_field('GOOGLE_CSE_ID')
+    opencorporates_api_key: str = _env_field('OPENCORPORATES_API_KEY')
+    # Per-host limits: sustained requests per second and concurrent requests in flight
+    google_requests_per_second: float = 10.0
+    opencorporates_requests_per_second: float = 2.0
+    max_concurrent_per_host: int = 5
+    # Businesses enriched at once by enrich_batch; keep small (5-128) to stay clear of API throttling
+    batch_concurrency: int = 20
     timeout_seconds: int = 30
     max_retries: int = 3
+    # Exponential backoff between attempts (doubling from the base, capped), unless Retry-After says otherwise
+    retry_backoff_seconds: float = 0.5
+    retry_backoff_max_seconds: float = 8.0
+    # Parsed search results are reused for this long, with at most cache_max_entries held in memory;
+    # set API_CACHE_PATH to persist them across runs
+    cache_ttl_seconds: float = 86400
+    cache_path: str = _env_field('API_CACHE_PATH')
+    cache_max_entries: int = 1024
+    # Open connections to each API host on startup so the first search skips DNS/TCP/TLS setup
+    warm_connections: bool = True
+    
+    def __post_init__(self):
+        for name in ('google_requests_per_second', 'opencorporates_requests_per_second'):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+
+GOOGLE_SEARCH_HOST = "www.googleapis.com"
+OPENCORPORATES_HOST = "api.opencorporates.com"
+
+# Email addresses in search snippets, compiled once for every parsed result
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Result URLs that point at a business listing page
+_BUSINESS_LISTING_DOMAINS = ('yelp.com', 'google.com/maps')
+
+@lru_cache(maxsize=64)
+def _juris_code(state: str) -> str:
+    """OpenCorporates jurisdiction code for a US state, e.g. 'TX' -> 'us_tx'"""
+    return f"us_{state.lower()}"
+
+# OpenCorporates company fields kept in the parsed result, by output name
+_COMPANY_FIELDS = {
+    'corporate_name': 'name',
+    'incorporation_date': 'incorporation_date',
+    'company_type': 'company_type',
+    'status': 'current_status',
+    'jurisdiction': 'jurisdiction_code',
+    'opencorporates_url': 'opencorporates_url'
+}
+
+# Registered-address components, in the order they are joined
+_ADDR_KEYS = ('street_address', 'locality', 'region', 'postal_code')
+
+# Throttling and transient upstream failures are worth another attempt; other statuses are final
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds (the delta-seconds form); None if absent or an HTTP date"""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+class ResponseCache:
+    """TTL cache of parsed API results, kept in memory and optionally persisted to SQLite
+    
+    Repeat lookups (same provider and query) skip the paid API entirely. The in-memory layer
+    is an LRU of at most `max_entries` results. The SQLite file uses WAL so concurrent demo
+    processes can share it; it is opened by `open()`, and it is opened, read, written and closed
+    in worker threads, off the event loop. Until `open()` the cache is memory-only.
+    """
+    
+    def __init__(self, path: str = '', ttl_seconds: float = 86400, max_entries: int = 1024):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, tuple] = OrderedDict()
+        self._db = None
+        # Worker threads take turns on the one connection
+        self._db_lock = threading.Lock()
+    
+    def _db_open(self):
+        with self._db_lock:
+            if self._db is not None:
+                return
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._db = db
+    
+    def _db_close(self):
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    async def open(self):
+        """Connect to the SQLite file, if one is configured; opening an open cache is a no-op"""
+        if self.path and self._db is None:
+            await asyncio.to_thread(self._db_open)
+    
+    @staticmethod
+    def make_key(provider: str, *parts: str) -> str:
+        return "|".join((provider, *(part.lower().strip() for part in parts)))
+    
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def _db_get(self, key: str) -> Optional[tuple]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT payload, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else (_json_loads(row[0]), row[1])
+    
+    def _db_set(self, key: str, payload: str, fetched_at: float):
+        with self._db_lock:
+            if self._db is None:
+                return
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, fetched_at) VALUES (?, ?, ?)",
+                    (key, payload, fetched_at)
+                )
+    
+    async def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None and now - entry[1] > self.ttl_seconds:
+            # Expired here, but another process may have stored a fresher row since
+            del self._memory[key]
+            entry = None
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._db_get, key)
+            if entry is not None and now - entry[1] > self.ttl_seconds:
+                entry = None
+        if entry is None:
+            return None
+        self._remember(key, entry)
+        return dict(entry[0])
+    
+    async def set(self, key: str, value: Dict):
+        fetched_at = time.time()
+        self._remember(key, (value, fetched_at))
+        if self._db is not None:
+            await asyncio.to_thread(self._db_set, key, _json_dumps(value), fetched_at)
+    
+    async def close(self):
+        if self._db is not None:
+            await asyncio.to_thread(self._db_close)
+
+def create_api_session(config: APIConfig) -> aiohttp.ClientSession:
+    """Long-lived HTTP session: pooled keep-alive connections and cached DNS per API host"""
+    # HTTP/1.1 needs one socket per concurrent request, so size the per-host pool to the
+    # per-host concurrency cap and keep idle sockets warm across rate-limited bursts
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=config.max_concurrent_per_host,
+        keepalive_timeout=60,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True
+    )
+    timeout = aiohttp.ClientTimeout(total=config.timeout_seconds)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
 
 class RealAPISearchProvider:
     """Real API integration for business data searches"""
     
-    def __init__(self, config: APIConfig):
+    def __init__(self, config: APIConfig, session: Optional[aiohttp.ClientSession] = None):
         self.config = config
-        self.session = None
+        # An injected session belongs to the caller; otherwise one is opened per context
+        self.session = session
+        self._owns_session = session is None
+        self.cache = ResponseCache(config.cache_path, config.cache_ttl_seconds, config.cache_max_entries)
+        
+        # Each API host gets its own concurrency cap and QPS budget, so one host's limits never stall the other
+        self._host_limits = {
+            host: (asyncio.Semaphore(config.max_concurrent_per_host), AsyncTokenBucket(rate, capacity=max(1.0, rate)))
+            for host, rate in (
+                (GOOGLE_SEARCH_HOST, config.google_requests_per_second),
+                (OPENCORPORATES_HOST, config.opencorporates_requests_per_second)
+            )
+        }
+        # Endpoint URLs with the fixed query parameters encoded once; each call only adds its own
+        self._google_url = yarl.URL(f"https://{GOOGLE_SEARCH_HOST}/customsearch/v1").with_query({
+            'key': config.google_search_api_key or '',
+            'cx': config.google_cse_id or '',
+            'num': 5,  # Limit results to control costs
+            # Partial response: only the item fields the parser reads are sent and decoded
+            'fields': 'items(title,snippet,link)'
+        })
+        # Only the best match is parsed, so don't transfer and decode the runners-up
+        opencorp_params = {'format': 'json', 'per_page': 1}
+        if config.opencorporates_api_key:
+            opencorp_params['api_token'] = config.opencorporates_api_key
+        self._opencorp_url = yarl.URL(f"https://{OPENCORPORATES_HOST}/v0.4/companies/search").with_query(opencorp_params)
+        # Identical lookups already on the wire share one fetch, keyed like the response cache
+        self._inflight: Dict[str, asyncio.Future] = {}
         
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        if self.session is None:
+            self.session = create_api_session(self.config)
+        await asyncio.gather(self.cache.open(), self.warm_up())
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+        await self.cache.close()
+    
+    async def warm_up(self):
+        """Resolve DNS and open a TLS connection to each configured API host ahead of the first search
+        
+        Each host gets a HEAD of its root page, which costs no API quota; failures are ignored and
+        simply leave that host cold.
+        """
+        if not self.config.warm_connections:
+            return
+        hosts = [OPENCORPORATES_HOST]
+        if self.config.google_search_api_key and self.config.google_cse_id:
+            hosts.append(GOOGLE_SEARCH_HOST)
+        
+        async def _head(host: str):
+            async with self.session.head(f"https://{host}/", allow_redirects=False):
+                pass
+        
+        await asyncio.gather(*(_head(host) for host in hosts), return_exceptions=True)
+    
+    async def _coalesced(self, key: str, fetch) -> Dict:
+        """Run fetch() once per key while it is in flight; concurrent callers await the same result"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one waiter being cancelled does not cancel the fetch for the others
+        return await asyncio.shield(future)
+    
+    @asynccontextmanager
+    async def _host_slot(self, host: str):
+        """Hold one of the host's request slots, after taking a token from its rate limiter"""
+        semaphore, bucket = self._host_limits[host]
+        async with semaphore:
+            await bucket.acquire()
+            yield
+    
+    async def _fetch_json(self, host: str, url: yarl.URL, api_name: str) -> Optional[Dict]:
+        """GET a JSON document, retrying 429/5xx responses and connection errors with backoff
+        
+        Makes up to max_retries attempts; returns None once they are exhausted or on a non-retryable 4xx status.
+        """
+        max_attempts = max(1, self.config.max_retries)
+        for attempt in range(1, max_attempts + 1):
+            retry_after = None
+            try:
+                async with self._host_slot(host), self.session.get(url) as response:
+                    response.raise_for_status()
+                    # Decode the raw body ourselves rather than through response.json()'s stdlib decoder
+                    return _json_loads(await response.read())
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUSES:
+                    logger.error(f"{api_name} API error: {e.status}")
+                    return None
+                retry_after = _parse_retry_after((e.headers or {}).get('Retry-After'))
+                logger.warning(f"{api_name} API returned {e.status} (attempt {attempt}/{max_attempts})")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"{api_name} request failed (attempt {attempt}/{max_attempts}): {e}")
+            
+            if attempt < max_attempts:
+                # Back off outside the host slot so other requests can use it meanwhile
+                if retry_after is None:
+                    backoff = self.config.retry_backoff_seconds * 2 ** (attempt - 1)
+                    retry_after = min(self.config.retry_backoff_max_seconds, backoff) * random.uniform(0.5, 1.0)
+                await asyncio.sleep(retry_after)
+        
+        logger.error(f"{api_name} API gave up after {max_attempts} attempts")
+        return None
     
     async def search_google_custom(self, business_name: str, location: str) -> Dict:
         """Real Google Custom Search API integration"""
@@ -49,27 +357,29 @@ class RealAPISearchProvider:
             logger.warning("Google API credentials not configured")
             return {}
             
+        cache_key = ResponseCache.make_key('google', business_name, location)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️  Using cached Google results for: {business_name}")
+            return cached
+            
+        return await self._coalesced(cache_key, lambda: self._fetch_google(business_name, location, cache_key))
+    
+    async def _fetch_google(self, business_name: str, location: str, cache_key: str) -> Dict:
         try:
             # Construct search query
             query = f"{business_name} business {location}"
-            url = "https://www.googleapis.com/customsearch/v1"
-            
-            params = {
-                'key': self.config.google_search_api_key,
-                'cx': self.config.google_cse_id,
-                'q': query,
-                'num': 5  # Limit results to control costs
-            }
+            url = self._google_url.update_query(q=query)
             
             logger.info(f"🔍 Searching Google for: {query}")
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_google_results(data, business_name)
-                else:
-                    logger.error(f"Google API error: {response.status}")
-                    return {}
+            data = await self._fetch_json(GOOGLE_SEARCH_HOST, url, "Google")
+            if data is None:
+                return {}
+            results = self._parse_google_results(data, business_name)
+            if results:
+                await self.cache.set(cache_key, results)
+            return results
                     
         except Exception as e:
             logger.error(f"Google search failed: {e}")
@@ -77,31 +387,30 @@ class RealAPISearchProvider:
     
     async def search_opencorporates(self, business_name: str, state: str) -> Dict:
         """Real OpenCorporates API integration"""
+        cache_key = ResponseCache.make_key('opencorporates', business_name, state)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"♻️  Using cached OpenCorporates results for: {business_name}")
+            return cached
+        
+        return await self._coalesced(cache_key, lambda: self._fetch_opencorporates(business_name, state, cache_key))
+    
+    async def _fetch_opencorporates(self, business_name: str, state: str, cache_key: str) -> Dict:
         try:
             # Clean business name for search
             clean_name = business_name.replace(',', '').strip()
             
-            url = "https://api.opencorporates.com/v0.4/companies/search"
-            params = {
-                'q': clean_name,
-                'jurisdiction_code': f"us_{state.lower()}",
-                'format': 'json',
-                'per_page': 3
-            }
-            
-            # Add API key if available
-            if self.config.opencorporates_api_key:
-                params['api_token'] = self.config.opencorporates_api_key
+            url = self._opencorp_url.update_query(q=clean_name, jurisdiction_code=_juris_code(state))
             
             logger.info(f"🏢 Searching OpenCorporates for: {clean_name} in {state}")
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_opencorporates_results(data)
-                else:
-                    logger.error(f"OpenCorporates API error: {response.status}")
-                    return {}
+            data = await self._fetch_json(OPENCORPORATES_HOST, url, "OpenCorporates")
+            if data is None:
+                return {}
+            results = self._parse_opencorporates_results(data)
+            if results:
+                await self.cache.set(cache_key, results)
+            return results
                     
         except Exception as e:
             logger.error(f"OpenCorporates search failed: {e}")
@@ -136,16 +445,14 @@ class RealAPISearchProvider:
                 # Look for business information patterns
                 if 'linkedin.com/company' in url:
                     result['linkedin'] = url
-                elif any(domain in url for domain in ['yelp.com', 'google.com/maps']):
+                elif any(domain in url for domain in _BUSINESS_LISTING_DOMAINS):
                     result['business_listing'] = url
                 
                 # Extract email patterns from snippets
                 if '@' in snippet and not result.get('corporate_email'):
-                    import re
-                    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                    emails = re.findall(email_pattern, snippet)
-                    if emails:
-                        result['corporate_email'] = emails[0]
+                    email_match = _EMAIL_RE.search(snippet)
+                    if email_match:
+                        result['corporate_email'] = email_match.group()
             
             result['source_urls'] = [item.get('link') for item in items[:3]]
             result['search_confidence'] = 0.7 if result else 0.3
@@ -166,18 +473,14 @@ class RealAPISearchProvider:
             # Take the first/best match
             company = companies[0].get('company', {})
             
-            result = {
-                'corporate_name': company.get('name'),
-                'corporate_address': self._format_address(company),
-                'incorporation_date': company.get('incorporation_date'),
-                'company_type': company.get('company_type'),
-                'status': company.get('current_status'),
-                'jurisdiction': company.get('jurisdiction_code'),
-                'opencorporates_url': company.get('opencorporates_url'),
-                'search_confidence': 0.9  # High confidence for official registry
-            }
+            # Registry fields copied in one pass, dropping empty values
+            result = {out: value for out, key in _COMPANY_FIELDS.items() if (value := company.get(key))}
+            address = self._format_address(company)
+            if address:
+                result['corporate_address'] = address
+            result['search_confidence'] = 0.9  # High confidence for official registry
             
-            return {k: v for k, v in result.items() if v}  # Remove empty values
+            return result
             
         except Exception as e:
             logger.error(f"Error parsing OpenCorporates results: {e}")
@@ -186,70 +489,145 @@ class RealAPISearchProvider:
     def _format_address(self, company: Dict) -> str:
         """Format company address from OpenCorporates data"""
         try:
-            address_parts = []
-            
-            if company.get('registered_address'):
-                addr = company['registered_address']
-                if addr.get('street_address'):
-                    address_parts.append(addr['street_address'])
-                if addr.get('locality'):
-                    address_parts.append(addr['locality'])
-                if addr.get('region'):
-                    address_parts.append(addr['region'])
-                if addr.get('postal_code'):
-                    address_parts.append(addr['postal_code'])
-            
-            return ', '.join(address_parts) if address_parts else ""
+            addr = company.get('registered_address') or {}
+            return ', '.join(part for key in _ADDR_KEYS if (part := addr.get(key)))
             
         except Exception:
             return ""
 
+@dataclass(slots=True, frozen=True)
+class APIRequirement:
+    """Cost and setup notes for one external API"""
+    name: str
+    cost: str
+    setup: str
+    env_vars: Tuple[str, ...]
+
+API_REQUIREMENTS = (
+    APIRequirement(
+        name="Google Custom Search",
+        cost="$5 per 1,000 queries",
+        setup="Enable Custom Search API in Google Cloud Console",
+        env_vars=("GOOGLE_SEARCH_API_KEY", "GOOGLE_CSE_ID")
+    ),
+    APIRequirement(
+        name="OpenCorporates",
+        cost="Free tier: 500 calls/month, Paid: $0.10/call",
+        setup="Register at opencorporates.com/api",
+        env_vars=("OPENCORPORATES_API_KEY",)
+    ),
+    APIRequirement(
+        name="Clearbit Enrichment",
+        cost="$99/month for 2,500 enrichments",
+        setup="Subscribe to Clearbit Enrichment API",
+        env_vars=("CLEARBIT_API_KEY",)
+    )
+)
+
 class RealAPIEnrichmentDemo:
     """Demonstration of real API integration patterns"""
     
     def __init__(self):
         self.config = APIConfig()
-        self.provider = RealAPISearchProvider(self.config)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.provider: Optional[RealAPISearchProvider] = None
+    
+    async def __aenter__(self):
+        # One session for the whole demo run so connections to each API are reused between enrichments
+        self.session = create_api_session(self.config)
+        self.provider = RealAPISearchProvider(self.config, self.session)
+        await asyncio.gather(self.provider.cache.open(), self.provider.warm_up())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self.provider:
+            await self.provider.cache.close()
     
     async def demonstrate_real_enrichment(self, business_name: str, location: str, state: str):
         """Demonstrate real API enrichment workflow"""
-        print(f"\n🔍 REAL API ENRICHMENT DEMO")
-        print(f"Business: {business_name}")
-        print(f"Location: {location}, {state}")
-        print("="*50)
+        logger.info(f"🔍 Enriching {business_name} ({location}, {state})")
         
-        async with self.provider as api:
-            results = {}
-            
-            # Google Custom Search
-            print("🔍 Searching Google Custom Search...")
-            google_results = await api.search_google_custom(business_name, location)
-            if google_results:
-                results.update(google_results)
-                print(f"✅ Google results: {len(google_results)} fields found")
-            else:
-                print("⚠️  No Google results (check API credentials)")
-            
-            # Rate limiting
-            await asyncio.sleep(self.config.rate_limit_delay)
-            
-            # OpenCorporates
-            print("🏢 Searching OpenCorporates...")
-            corp_results = await api.search_opencorporates(business_name, state)
-            if corp_results:
-                results.update(corp_results)
-                print(f"✅ OpenCorporates results: {len(corp_results)} fields found")
-            else:
-                print("⚠️  No OpenCorporates results")
-            
-            # Rate limiting
-            await asyncio.sleep(self.config.rate_limit_delay)
-            
-            # Clearbit (placeholder)
-            print("💼 Clearbit enrichment...")
-            clearbit_results = await api.search_clearbit_enrichment(business_name)
-            print("ℹ️  Clearbit integration ready (requires paid subscription)")
+        api = self.provider
+        results = {}
+        
+        # Google Custom Search and OpenCorporates are independent hosts, so query both at once
+        logger.debug("Searching Google Custom Search and OpenCorporates")
+        google_results, corp_results = await asyncio.gather(
+            api.search_google_custom(business_name, location),
+            api.search_opencorporates(business_name, state),
+            return_exceptions=True
+        )
+        if isinstance(google_results, Exception):
+            logger.error(f"Google search failed: {google_results}")
+            google_results = {}
+        if isinstance(corp_results, Exception):
+            logger.error(f"OpenCorporates search failed: {corp_results}")
+            corp_results = {}
         
+        if google_results:
+            results.update(google_results)
+            logger.info(f"✅ Google results: {len(google_results)} fields found")
+        else:
+            logger.info("⚠️  No Google results (check API credentials)")
+        
+        if corp_results:
+            results.update(corp_results)
+            logger.info(f"✅ OpenCorporates results: {len(corp_results)} fields found")
+        else:
+            logger.info("⚠️  No OpenCorporates results")
+        
+        # Clearbit (placeholder)
+        logger.debug("Clearbit enrichment (placeholder; requires paid subscription)")
+        clearbit_results = await api.search_clearbit_enrichment(business_name)
+    
+        return results
+    
+    async def submit_many(self, businesses: List[Tuple[str, str, str]],
+                          io_depth: Optional[int] = None) -> AsyncIterator[Tuple[int, Dict]]:
+        """Yield (index, result) for each (business_name, location, state) tuple as it completes
+        
+        Keeps up to `io_depth` (default config.batch_concurrency) enrichments in flight, topping
+        the window back up as each one finishes instead of waiting on the slowest of a batch.
+        A failed enrichment yields {}.
+        """
+        depth = max(1, io_depth or self.config.batch_concurrency)
+        queued = iter(enumerate(businesses))
+        pending: Dict[asyncio.Task, int] = {}
+        try:
+            while True:
+                for index, business in queued:
+                    pending[asyncio.create_task(self.demonstrate_real_enrichment(*business))] = index
+                    if len(pending) >= depth:
+                        break
+                if not pending:
+                    return
+                
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    if task.exception() is not None:
+                        logger.error(f"Enrichment failed for {businesses[index][0]}: {task.exception()}")
+                        yield index, {}
+                    else:
+                        yield index, task.result()
+        finally:
+            # Consumer stopped early: don't leave orphaned requests running
+            for task in pending:
+                task.cancel()
+    
+    async def enrich_batch(self, businesses: List[Tuple[str, str, str]],
+                           concurrency: Optional[int] = None) -> List[Dict]:
+        """Enrich many (business_name, location, state) tuples concurrently, in input order
+        
+        At most `concurrency` (default config.batch_concurrency) enrichments run at once, all
+        sharing the demo's session and per-host limits. A failed enrichment yields {}.
+        """
+        results: List[Dict] = [{}] * len(businesses)
+        async for index, result in self.submit_many(businesses, io_depth=concurrency):
+            results[index] = result
         return results
     
     def display_api_requirements(self):
@@ -257,32 +635,11 @@ class RealAPIEnrichmentDemo:
         print("\n📋 REAL API INTEGRATION REQUIREMENTS")
         print("="*50)
         
-        apis = [
-            {
-                "name": "Google Custom Search",
-                "cost": "$5 per 1,000 queries",
-                "setup": "Enable Custom Search API in Google Cloud Console",
-                "env_vars": ["GOOGLE_SEARCH_API_KEY", "GOOGLE_CSE_ID"]
-            },
-            {
-                "name": "OpenCorporates",
-                "cost": "Free tier: 500 calls/month, Paid: $0.10/call",
-                "setup": "Register at opencorporates.com/api",
-                "env_vars": ["OPENCORPORATES_API_KEY"]
-            },
-            {
-                "name": "Clearbit Enrichment", 
-                "cost": "$99/month for 2,500 enrichments",
-                "setup": "Subscribe to Clearbit Enrichment API",
-                "env_vars": ["CLEARBIT_API_KEY"]
-            }
-        ]
-        
-        for api in apis:
-            print(f"\n🔧 {api['name']}:")
-            print(f"   Cost: {api['cost']}")
-            print(f"   Setup: {api['setup']}")
-            print(f"   Environment: {', '.join(api['env_vars'])}")
+        for api in API_REQUIREMENTS:
+            print(f"\n🔧 {api.name}:")
+            print(f"   Cost: {api.cost}")
+            print(f"   Setup: {api.setup}")
+            print(f"   Environment: {', '.join(api.env_vars)}")
         
         print(f"\n💰 ESTIMATED COSTS for 1,000 records:")
         print(f"   Google Search: ~$5-10")
@@ -292,6 +649,7 @@ class RealAPIEnrichmentDemo:
 
 async def main():
     """Demonstrate real API integration capabilities"""
+    log_listener = setup_logging()
     demo = RealAPIEnrichmentDemo()
     
     print("🚀 REAL API INTEGRATION DEMONSTRATION")
@@ -310,9 +668,10 @@ async def main():
     print("(Using sample business from your Golden Chick data)")
     
     try:
-        results = await demo.demonstrate_real_enrichment(
-            sample_business, sample_location, sample_state
-        )
+        async with demo:
+            results = await demo.demonstrate_real_enrichment(
+                sample_business, sample_location, sample_state
+            )
         
         print(f"\n📊 ENRICHMENT RESULTS:")
         if results:
@@ -333,6 +692,9 @@ async def main():
     print(f"\n🎯 RECOMMENDATION:")
     print("Use the mock implementation for assessment/development")
     print("Deploy with real APIs when ready for production")
+    
+    if log_listener:
+        log_listener.stop()
 
 if __name__ == "__main__":
     asyncio.run(main())
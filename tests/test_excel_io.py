@@ -0,0 +1,32 @@
+import math
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("xlsxwriter")
+pytest.importorskip("openpyxl")
+
+import excel_io
+
+
+def test_write_excel_streaming_keeps_every_cell(tmp_path):
+    # constant_memory drops cells written out of row order; every column must survive
+    df = pd.DataFrame({
+        "Franchisee": ["Adam Fried Chicken, LLC", "Kess Management Corporation", "Smith, John"],
+        "Zip": [75001, 75002, 75003],
+        "Phone": ["972-555-0100", float("nan"), "214-555-0199"],
+        "LinkedIn": ["https://linkedin.com/company/adam", "", "https://linkedin.com/in/john-smith"],
+        "Agent Confidence": [0.9, 0.8, 0.85],
+    })
+    path = tmp_path / "out.xlsx"
+
+    excel_io.write_excel_streaming(df, str(path))
+
+    saved = pd.read_excel(path, engine="openpyxl")
+    assert list(saved.columns) == list(df.columns)
+    assert saved["Franchisee"].tolist() == df["Franchisee"].tolist()
+    assert saved["Zip"].tolist() == df["Zip"].tolist()
+    assert saved["Agent Confidence"].tolist() == df["Agent Confidence"].tolist()
+    # Missing and empty values are written as blank cells
+    assert saved["Phone"][0] == "972-555-0100" and math.isnan(saved["Phone"][1])
+    assert saved["LinkedIn"][2] == "https://linkedin.com/in/john-smith" and math.isnan(saved["LinkedIn"][1])